@@ -10,36 +10,29 @@ ANSWERS_DIR = "answer"
 SUBMISSIONS_DIR = "submissions"
 U_GT_PATH = os.path.join(ANSWERS_DIR, "answer-u.json")
 S_GT_PATH = os.path.join(ANSWERS_DIR, "answer-s.json")
+PRIVATE_RESULTS_PATH = os.path.join("private", "leaderboard-private.json")
+
+# 答案中每条记录可带 "split" 字段；缺省视为 public
+SPLITS = ("public", "private")
+DEFAULT_SPLIT = "public"
+U_TYPES = ("yes-or-no", "what", "how")
 
 
 def load_ground_truth():
     gt = {}
-    with open(U_GT_PATH, 'r', encoding='utf-8') as f:
-        u_list = json.load(f)["predictions"]
-        gt['U'] = {item['id']: item for item in u_list}
-    with open(S_GT_PATH, 'r', encoding='utf-8') as f:
-        s_list = json.load(f)["predictions"]
-        gt['S'] = {item['id']: item for item in s_list}
+    for track, path in (("U", U_GT_PATH), ("S", S_GT_PATH)):
+        with open(path, 'r', encoding='utf-8') as f:
+            items = json.load(f)["predictions"]
+        for item in items:
+            split = str(item.get("split", DEFAULT_SPLIT)).strip().lower()
+            if split not in SPLITS:
+                raise ValueError(f"{path}: id {item['id']} 的 split 未知: {split}")
+            item["split"] = split
+        gt[track] = {item['id']: item for item in items}
     return gt
 
 
-def evaluate_u(preds, gt_dict):
-    correct = {"yes-or-no": 0, "what": 0, "how": 0}
-    total = {"yes-or-no": 0, "what": 0, "how": 0}
-    for p in preds:
-        q_id = p.get("id")
-        if q_id not in gt_dict:
-            continue
-        gt = gt_dict[q_id]
-        q_type = gt["type"]
-        if q_type not in total:
-            continue
-        gt_ans = str(gt["precision"]).strip().upper()
-        pred_ans = str(p.get("precision", "")).strip().upper()
-        total[q_type] += 1
-        if gt_ans == pred_ans:
-            correct[q_type] += 1
-
+def u_metrics(correct, total):
     acc = {t: correct[t] / total[t] if total[t] > 0 else 0.0 for t in total}
     score = 0.2 * acc["yes-or-no"] + 0.3 * acc["what"] + 0.5 * acc["how"]
 
@@ -51,26 +44,39 @@ def evaluate_u(preds, gt_dict):
     }
 
 
-def evaluate_s(preds, gt_dict):
-    gt_p, pred_p = [], []
-    gt_k, pred_k = [], []
+def evaluate_u(preds, gt_dict):
+    """一次遍历提交，按 split 分组累计，返回 {split: 指标}"""
+    correct = {s: dict.fromkeys(U_TYPES, 0) for s in SPLITS}
+    total = {s: dict.fromkeys(U_TYPES, 0) for s in SPLITS}
     for p in preds:
         q_id = p.get("id")
         if q_id not in gt_dict:
             continue
-        gt_item = gt_dict[q_id]
-        p_pred = p.get("perception")
-        k_pred = p.get("knowledge")
-        if None in [gt_item.get("perception"), gt_item.get("knowledge"), p_pred, k_pred]:
-            continue
-        try:
-            gt_p.append(float(gt_item["perception"]))
-            pred_p.append(float(p_pred))
-            gt_k.append(float(gt_item["knowledge"]))
-            pred_k.append(float(k_pred))
-        except (TypeError, ValueError):
+        gt = gt_dict[q_id]
+        q_type = gt["type"]
+        if q_type not in U_TYPES:
             continue
+        split = gt["split"]
+        gt_ans = str(gt["precision"]).strip().upper()
+        pred_ans = str(p.get("precision", "")).strip().upper()
+        total[split][q_type] += 1
+        if gt_ans == pred_ans:
+            correct[split][q_type] += 1
+
+    return {s: u_metrics(correct[s], total[s]) for s in SPLITS}
+
+
+def safe_corr(x, y):
+    if len(x) < 2 or np.all(x == x[0]) or np.all(y == y[0]):
+        return 0.0, 0.0
+    srcc, _ = spearmanr(x, y)
+    plcc, _ = pearsonr(x, y)
+    srcc = srcc if not np.isnan(srcc) else 0.0
+    plcc = plcc if not np.isnan(plcc) else 0.0
+    return max(float(srcc), 0.0), max(float(plcc), 0.0)
+
 
+def s_metrics(gt_p, pred_p, gt_k, pred_k):
     if len(gt_p) == 0:
         return {
             "score": 0.0,
@@ -78,15 +84,6 @@ def evaluate_s(preds, gt_dict):
             "srcc_k": 0.0, "plcc_k": 0.0,
         }
 
-    def safe_corr(x, y):
-        if len(set(x)) == 1 or len(set(y)) == 1:
-            return 0.0
-        srcc, _ = spearmanr(x, y)
-        plcc, _ = pearsonr(x, y)
-        srcc = srcc if not np.isnan(srcc) else 0.0
-        plcc = plcc if not np.isnan(plcc) else 0.0
-        return max(srcc, 0.0), max(plcc, 0.0)
-
     srcc_p, plcc_p = safe_corr(gt_p, pred_p)
     srcc_k, plcc_k = safe_corr(gt_k, pred_k)
 
@@ -103,6 +100,66 @@ def evaluate_s(preds, gt_dict):
     }
 
 
+def evaluate_s(preds, gt_dict):
+    """一次解析提交，按 split 掩码分别计算相关系数，返回 {split: 指标}"""
+    rows, splits = [], []
+    for p in preds:
+        q_id = p.get("id")
+        if q_id not in gt_dict:
+            continue
+        gt_item = gt_dict[q_id]
+        p_pred = p.get("perception")
+        k_pred = p.get("knowledge")
+        if None in [gt_item.get("perception"), gt_item.get("knowledge"), p_pred, k_pred]:
+            continue
+        try:
+            row = (float(gt_item["perception"]), float(p_pred),
+                   float(gt_item["knowledge"]), float(k_pred))
+        except (TypeError, ValueError):
+            continue
+        rows.append(row)
+        splits.append(gt_item["split"])
+
+    values = np.asarray(rows, dtype=float).reshape(-1, 4)
+    splits = np.asarray(splits)
+
+    results = {}
+    for s in SPLITS:
+        mask = splits == s
+        gt_p, pred_p, gt_k, pred_k = values[mask].T
+        results[s] = s_metrics(gt_p, pred_p, gt_k, pred_k)
+    return results
+
+
+def select_split(teams, split):
+    return {
+        team: {
+            "U": data["U"][split] if data["U"] else None,
+            "S": data["S"][split] if data["S"] else None,
+            "method": data["method"],
+        }
+        for team, data in teams.items()
+    }
+
+
+def write_private_results(teams, timestamp):
+    """private 榜单不进入页面，单独写入 PRIVATE_RESULTS_PATH"""
+    entries = []
+    for team, scores in select_split(teams, "private").items():
+        u_score = scores["U"]["score"] if scores["U"] else 0.0
+        s_score = scores["S"]["score"] if scores["S"] else 0.0
+        combined = (u_score + s_score) / 2 if (u_score > 0 or s_score > 0) else 0.0
+        entries.append({"team": team, **scores, "Combined": round(combined, 2)})
+    entries.sort(key=lambda x: x["Combined"], reverse=True)
+
+    os.makedirs(os.path.dirname(PRIVATE_RESULTS_PATH), exist_ok=True)
+    with open(PRIVATE_RESULTS_PATH, "w", encoding="utf-8") as f:
+        json.dump({"split": "private", "updated": timestamp, "teams": entries},
+                  f, ensure_ascii=False, indent=2)
+
+    print(f"🔒 Private results written: {PRIVATE_RESULTS_PATH}")
+
+
 def escape_html(text):
     return (str(text)
             .replace("&", "&amp;")
@@ -147,6 +204,8 @@ def main():
             print(f"❌ 处理失败 {file_path}: {e}")
 
     timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
+    write_private_results(teams, timestamp)
+    teams = select_split(teams, "public")
 
     # --- 计算 Overall 排名 ---
     overall_list = []